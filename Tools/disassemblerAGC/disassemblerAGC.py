@@ -103,7 +103,7 @@ if cli.block1:
     from searchSpecialBlockI import searchPatterns
 else:
     from searchSpecial import searchPatterns
-from searchFunctions import importFlexFile, searchSpecial, specialSubroutines
+from searchFunctions import importFlexFile, searchSpecial
 
 # If necessary, import patterns from a file specified by the --flex
 # command-line switch, and append them to the searchPatterns dictionary
@@ -186,8 +186,9 @@ if cli.checkFilename != "":
 # Search for special symbols like INTPRET, BANKCALL, ....  Their addresses
 # will be stored as specialSubroutines["INTPRET"] (and so on).
 
-searchSpecial(core, searchPatterns, disassembleBasic, 
-                disassembleInterpretive, interpretiveStart, bankListBin)
+specialSubroutines = searchSpecial(core, searchPatterns, disassembleBasic, 
+                                   disassembleInterpretive, interpretiveStart,
+                                   bankListBin)
 
 if cli.intpret != -1:
     INTPRET = cli.intpret
@@ -797,6 +798,11 @@ if cli.findFilename != "":
     # they're printed out.
     def norm(symbol):
         return symbol.replace("!", "'")
+    
+    # Translation tables for stripping punctuation from the string forms of
+    # lists and tuples in a single pass.
+    stripList = str.maketrans("", "", "[]'")
+    stripParentheses = str.maketrans("", "", "()")
 
     # First step: Read in the entire pattern file into the dictionaries
     # desiredMatches
@@ -1102,8 +1108,8 @@ if cli.findFilename != "":
             # collected.  We now have to perform some statistics to decide
             # what we can report about what address we can report for this
             # symbol.
-            sSymbols = str(sorted(symbols)).replace("[", "").replace("]", "")
-            sSymbols = sSymbols.replace("'", "").replace(", ", " = ")
+            sSymbols = str(sorted(symbols)).translate(stripList)
+            sSymbols = sSymbols.replace(", ", " = ")
             stats = {}
             if False: # old method
                 for i in range(len(spec["references"])):
@@ -1425,7 +1431,7 @@ if cli.findFilename != "":
             for symbol in sorted(foundErasables):
                 #print(symbol, "=", foundErasables[symbol])
                 #print(symbol, foundErasables[symbol], file=sys.stderr)
-                found = foundErasables[symbol].replace("(", "").replace(")", "")
+                found = foundErasables[symbol].translate(stripParentheses)
                 fields = found.split(",")
                 if len(fields) == 1:
                     perror, pfixed, bank1, address1, poffset = \
@@ -82,9 +82,15 @@ However the initial RELINT is optional, and we don't care about any of the
 operands except that CA's operand must be either 0004 or 0006.
 
 It would be clever to somehow encode these things as regular expressions,
-and thus get a much-more-flexible (and presumably more-efficient) matching
-mechanism, but I haven't given that any thought.  The search is strictly
-brute force at this point.
+and thus get a much-more-flexible matching mechanism, but I haven't given
+that any thought.  Instead, the search is still basically a matter of trying
+the pattern at each starting offset in turn, but with some of the drudgery
+removed:  each bank searched is disassembled (as basic instructions) just
+once, into tables of small integer IDs for the opcodes and operands, and
+each pattern is compiled into bitmasks and sets of those IDs.  Moreover, for
+basic patterns, the only starting offsets tried are those at which the
+first required opcode of the pattern appears, as found from a per-bank index
+of the positions of each opcode.
 
 The output is a dictionary with a key for each special symbol, and values
 of the form
@@ -94,14 +100,19 @@ fixedFixedAddress, which is in the octal range 4000-7777 for banks 02 and 03,
 will also be -1 for banks other then 02 or 03.
 """
 
+# The contents of a --flex file are the entries of a Python dictionary
+# literal, in the same form as searchPatterns in searchSpecial.py.  They're
+# read in a single gulp and parsed as a literal rather than evaluated, 
+# falling back to evaluation only for files which use expressions (such as 
+# 0o2000-0o100) in their ranges.  Since line breaks are preserved, the 
+# file may contain # comments.
 def importFlexFile(flexFilename, searchPatterns, minFlex=8):
-    f = open(flexFilename, "r")
-    exp = "{"
-    for line in f:
-        exp += " " + line.strip()
-    f.close()
-    exp += "}"
-    temp = eval(exp)
+    with open(flexFilename, "r") as f:
+        exp = "{" + f.read() + "\n}"
+    try:
+        temp = ast.literal_eval(exp)
+    except ValueError:
+        temp = eval(exp)
     willDelete = []
     for symbol in temp:
         for entry in temp[symbol]:
@@ -127,191 +138,459 @@ def importFlexFile(flexFilename, searchPatterns, minFlex=8):
                     print(key, "=", pattern[key])
     '''
 
+import sys
+import os
+import ast
+import multiprocessing
+import concurrent.futures
+import concurrent.futures.process
+from bisect import bisect_left
+
+# Opcode and operand strings (basic or interpretive) are converted to small 
+# integer IDs, assigned on demand, so that the matching in searchSpecial() 
+# compares integers rather than strings, and so that a set of acceptable 
+# opcodes can be represented as a bitmask with bit 1 << ID set for each 
+# opcode.  An operand consisting of exactly 4 octal digits, which is how 
+# numerical addresses are disassembled, is instead its own numerical value,
+# so that the acceptable numerical operands of a pattern are simply a set of
+# addresses.  Other operands are assigned IDs from 0o10000 upward, and
+# operandNames lists only those.
+opcodeIds = {}
+opcodeNames = []
+operandIds = {}
+operandNames = []
+octalDigits = frozenset("01234567")
+def internString(ids, names, string):
+    if string not in ids:
+        ids[string] = len(names)
+        names.append(string)
+    return ids[string]
+def opcodeId(opcode):
+    return internString(opcodeIds, opcodeNames, opcode)
+def operandId(operand):
+    id = operandIds.get(operand)
+    if id is None:
+        if len(operand) == 4 and octalDigits.issuperset(operand):
+            id = int(operand, 8)
+        else:
+            id = 0o10000 + len(operandNames)
+            operandNames.append(operand)
+        operandIds[operand] = id
+    return id
+
+# Converts the "pattern" list of a search pattern into 3 parallel lists,
+# stored in the search pattern as "required", "opcodes", and "operands", so
+# that searchSpecial() needn't index into the pattern entries or do linear
+# searches of the lists of acceptable opcodes and operands.  The lists of
+# acceptable opcodes become bitmasks of opcode IDs, and the lists of 
+# acceptable operands become frozensets of operand IDs, except that empty 
+# lists (which match anything) become None.  Also stored is "firstRequired",
+# the index of the first required step of the pattern.
+def compilePattern(searchPattern):
+    pattern = searchPattern["pattern"]
+    searchPattern["required"] = [p[0] for p in pattern]
+    searchPattern["firstRequired"] = next((i for i in range(len(pattern)) \
+                                           if pattern[i][0]), len(pattern))
+    opcodes = []
+    for p in pattern:
+        if len(p[1]) == 0:
+            opcodes.append(None)
+            continue
+        mask = 0
+        for opcode in p[1]:
+            mask |= 1 << opcodeId(opcode)
+        opcodes.append(mask)
+    searchPattern["opcodes"] = opcodes
+    searchPattern["operands"] = [frozenset(operandId(operand) \
+                                           for operand in p[2]) \
+                                 if len(p[2]) > 0 else None for p in pattern]
+
+# Disassembles every word in a bank of core as a basic instruction, both as 
+# non-extended and (where the preceding instruction can make it so) as 
+# extended.  Returns a dictionary whose "opcodes", "operands", and 
+# "nextExtended" keys are tables, indexed as [extended][offset], of the 
+# opcode IDs, the operand IDs, and the values of 'extended' with which the 
+# instruction at offset+1 must be disassembled.  Extended entries which can
+# never be reached are -1.  The "opcodeIndex" key is an index of the opcodes
+# as disassembled non-extended, which is how the first instruction of a match
+# is always disassembled:  it's a dictionary, keyed by opcode ID, of the 
+# sorted lists of offsets at which each opcode appears.
+def disassembleBank(coreBank, disassembleBasic):
+    size = len(coreBank)
+    opcodes, operands, nextExtended = \
+        zip(*[disassembleBasic(word, False) for word in coreBank])
+    extendedOpcodes = [-1] * size
+    extendedOperands = [-1] * size
+    extendedNextExtended = [False] * size
+    for offset in range(1, size):
+        if nextExtended[offset - 1] or extendedNextExtended[offset - 1]:
+            extendedOpcodes[offset], extendedOperands[offset], \
+                extendedNextExtended[offset] = \
+                    disassembleBasic(coreBank[offset], True)
+            extendedOpcodes[offset] = opcodeId(extendedOpcodes[offset])
+            extendedOperands[offset] = operandId(extendedOperands[offset])
+    opcodes = [opcodeId(opcode) for opcode in opcodes]
+    operands = [operandId(operand) for operand in operands]
+    tables = {
+        "opcodes": (opcodes, extendedOpcodes),
+        "operands": (operands, extendedOperands),
+        "nextExtended": (nextExtended, extendedNextExtended)
+        }
+    opcodePositions = {}
+    for offset, opcode in enumerate(opcodes):
+        if opcode in opcodePositions:
+            opcodePositions[opcode].append(offset)
+        else:
+            opcodePositions[opcode] = [offset]
+    tables["opcodeIndex"] = opcodePositions
+    return tables
+
+# Tries to match searchPattern at testOffset in the bank, starting out as 
+# basic code or (if basic is False) as interpretive code.  Returns True if 
+# the entire pattern matches before endingOffset.  Optional steps at the 
+# beginning of the pattern are skipped, since they don't affect whether there 
+# is a match, only the address assigned to the symbol; backtrackMatch() 
+# takes care of them afterward.
+def tryMatch(searchPattern, testOffset, basic, bank, bankTable, endingOffset, 
+             TC, intpretOperands, core, disassembleInterpretive, 
+             interpretiveStart):
+    pattern = searchPattern["pattern"]
+    requireds = searchPattern["required"]
+    opcodes = searchPattern["opcodes"]
+    operands = searchPattern["operands"]
+    bankOpcodes = bankTable["opcodes"]
+    bankOperands = bankTable["operands"]
+    bankNextExtended = bankTable["nextExtended"]
+    # iPat is the index into the pattern, and extended is the state in which
+    # the instruction at offset is to be disassembled.
+    iPat = searchPattern["firstRequired"]
+    offset = testOffset
+    extended = False
+    if not basic:
+        state = interpretiveStart()
+    while offset < endingOffset and iPat < len(pattern):
+        if basic:
+            # Note that 'extended' is the state in which the
+            # instruction at the current offset is to be
+            # disassembled, and changes only when the offset
+            # advances.
+            opcode = bankOpcodes[extended][offset]
+            operand = bankOperands[extended][offset]
+            desiredOpcodes = opcodes[iPat]
+            desiredOperands = operands[iPat]
+            if desiredOpcodes is None \
+                    or desiredOpcodes >> opcode & 1:
+                if desiredOperands is None \
+                        or operand in desiredOperands:
+                    extended = bankNextExtended[extended][offset]
+                    iPat += 1
+                    offset += 1
+                    if opcode == TC \
+                            and operand in intpretOperands:
+                        basic = False
+                        state = interpretiveStart()
+                    continue
+            if requireds[iPat]:
+                return False
+            iPat += 1 # Note: offset does not increment.
+        else: # interpretive.
+            # For interpretive code, we can't really handle 
+            # too many alternatives because of the fact
+            # that only complete "equations" (or "strings")
+            # of lines can be meaningfully disassembled,
+            # as opposed to individual words.
+            disassembly, basic = \
+                disassembleInterpretive(core, bank, offset, state)
+            for d in disassembly:
+                left = d[0]
+                right = d[1]
+                if right == "":
+                    right = d[2]
+                desiredLeft = opcodes[iPat]
+                desiredRight = operands[iPat]
+                if desiredLeft is None \
+                        or desiredLeft >> opcodeId(left) & 1:
+                    if desiredRight is None \
+                            or operandId(right) in desiredRight:
+                        iPat += 1
+                        offset += 1
+                        continue
+                return False
+    return iPat >= len(pattern)
+
+# Returns the fixed-fixed address (0o4000-0o7777) of the given offset in a
+# fixed bank, or -1 if the bank isn't fixed-fixed.
+fixedFixedBanks = frozenset((2, 3))
+def fixedFixedAddress(bank, offset):
+    if bank in fixedFixedBanks:
+        return (bank << 10) + offset
+    return -1
+
+# Called once searchPattern has been found to match at bank,testOffset, and
+# returns the same thing as searchSymbol().  If there were optional matches
+# at the beginning of the pattern, those haven't been checked, so we have to 
+# check those in case testOffset needs to be decremented.
+def backtrackMatch(symbol, searchPattern, bank, bankTable, testOffset, 
+                   startingOffset):
+    opcodes = searchPattern["opcodes"]
+    operands = searchPattern["operands"]
+    bankOpcodes = bankTable["opcodes"]
+    bankOperands = bankTable["operands"]
+    fixedFixed = fixedFixedAddress(bank, testOffset)
+    result = (bank, testOffset, fixedFixed, searchPattern,
+              symbol, searchPattern["dataWords"])
+    matchFixedFixed = fixedFixed
+    iPat = searchPattern["firstRequired"]
+    offset = testOffset
+    while iPat > 0 and offset > startingOffset:
+        iPat -= 1
+        offset -= 1
+        desiredOpcodes = opcodes[iPat]
+        desiredOperands = operands[iPat]
+        opcode = bankOpcodes[False][offset]
+        operand = bankOperands[False][offset]
+        if desiredOpcodes is not None \
+                and desiredOpcodes >> opcode & 1:
+            if desiredOperands is None \
+                    or operand in desiredOperands:
+                # testOffset -= 1
+                fixedFixed = fixedFixedAddress(bank, offset)
+                result = (bank, offset, fixedFixed, 
+                          searchPattern, symbol, 
+                          searchPattern["dataWords"])
+                continue
+            else: # Does not match!
+                break
+    return result, matchFixedFixed
+
+# Searches for a single special symbol, given the list of its search 
+# patterns.  Returns the tuple for the symbol described at the top of this 
+# file, along with the fixed-fixed address (or -1) at which the first 
+# required instruction of the pattern was matched.  The specialSubroutines
+# parameter holds the symbols already found, bankTables caches the results
+# of disassembleBank(), and intpretOperands are the operand IDs of a TC 
+# which transfers to the interpreter.  The remaining parameters are as for
+# searchSpecial().
+def searchSymbol(symbol, searchPatternList, specialSubroutines, bankTables, 
+                 intpretOperands, core, disassembleBasic, 
+                 disassembleInterpretive, interpretiveStart, bankList):
+    TC = opcodeId("TC")
+    for searchPattern in searchPatternList:
+        pattern = searchPattern["pattern"]
+        opcodes = searchPattern["opcodes"]
+        firstRequired = searchPattern["firstRequired"]
+        ranges = searchPattern["ranges"]
+        if "basic" not in searchPattern:
+            startBasic = True
+        else:
+            startBasic = searchPattern["basic"]
+        if len(ranges) == 0:
+            ranges = []
+            for bank in bankList:
+                ranges.append([bank, 0o0000, 0o2000])
+        for searchRange in ranges:
+            bank = searchRange[0]
+            startingOffset = searchRange[1]
+            # Usually searchRange[1] is a number, but if it's a string,
+            # then it's the name of a special symbol whose pattern, we
+            # fear, will unfortunately match the symbol we're now trying
+            # to find.  BANKCALL and IBNKCALL have that relationship.
+            # In that case, we adjust the starting range accordingly to
+            # avoid that.  This only works if the 2nd symbol we're 
+            # searching for is at a higher offset than the 1st symbol 
+            # we already found.
+            if startingOffset in specialSubroutines:
+                startingOffset = specialSubroutines[startingOffset][1] + 1
+            endingOffset = searchRange[2]
+            if bank not in bankTables:
+                bankTables[bank] = disassembleBank(core[bank], 
+                                                   disassembleBasic)
+            bankOpcodeIndex = bankTables[bank]["opcodeIndex"]
+            # For basic patterns, the only starting offsets worth trying
+            # are those at which the first required opcode appears.
+            if startBasic and firstRequired < len(pattern) \
+                    and opcodes[firstRequired] is not None:
+                firstOpcodes = opcodes[firstRequired]
+                testOffsets = []
+                for opcode, positions in bankOpcodeIndex.items():
+                    if not firstOpcodes >> opcode & 1:
+                        continue
+                    testOffsets += positions[
+                        bisect_left(positions, startingOffset) :
+                        bisect_left(positions, endingOffset)]
+                testOffsets.sort()
+            else:
+                testOffsets = range(startingOffset, endingOffset)
+            for testOffset in testOffsets:
+                if tryMatch(searchPattern, testOffset, startBasic, bank, 
+                            bankTables[bank], endingOffset, TC, 
+                            intpretOperands, core, disassembleInterpretive,
+                            interpretiveStart):
+                    return backtrackMatch(symbol, searchPattern, bank, 
+                                          bankTables[bank], testOffset,
+                                          startingOffset)
+    return (-1, -1, -1, {}, symbol, 0), -1 # Mark as not found.
+
+# Returns True if any of a symbol's search patterns refers to some other
+# special symbol, either as the start of a search range or as an operand.
+def refersToSymbols(searchPatternList, searchPatterns):
+    for searchPattern in searchPatternList:
+        for searchRange in searchPattern["ranges"]:
+            if searchRange[1] in searchPatterns:
+                return True
+        for p in searchPattern["pattern"]:
+            for operand in p[2]:
+                if operand in searchPatterns:
+                    return True
+    return False
+
+# Symbols whose patterns don't refer to other special symbols are searched for
+# in separate processes, if the operating system supports fork() and if 
+# worthParallelizing() says that it pays off.  (The disassembler's modules 
+# can't simply be re-imported by freshly-spawned processes, since they act on
+# the command line when imported.)  For SundialE and its --flex file, the 
+# searches average about 2.3 ms per symbol, and starting the processes and 
+# collecting the results costs about 50 ms.  Spreading the searches for n 
+# symbols over w processes saves about n*(1-1/w)*2.3 ms, so the break-even 
+# point is around 44 symbols for 2 CPUs, 33 for 3, 29 for 4, and never drops
+# below 22.
+symbolSearchTime = 2.3 # Milliseconds.
+parallelOverhead = 50.0 # Milliseconds.
+def worthParallelizing(numSymbols, workers):
+    return workers > 1 and \
+        numSymbols * symbolSearchTime * (1 - 1 / workers) > parallelOverhead
+
+# The searchPatterns and the remaining parameters of searchSymbol(), for
+# use by parallelSearchSymbol() in the forked processes.
+parallelSearch = None
+
+def parallelSearchSymbol(symbol):
+    searchPatterns, args = parallelSearch
+    result, matchFixedFixed = searchSymbol(symbol, searchPatterns[symbol], 
+                                           *args)
+    # Return the search pattern by its index instead, since a copy of it 
+    # is of no use to the parent process.
+    for i in range(len(searchPatterns[symbol])):
+        if result[3] is searchPatterns[symbol][i]:
+            result = result[:3] + (i,) + result[4:]
+    return result, matchFixedFixed
+
+# Searches for the given symbols, which must be independent of other special
+# symbols, in parallel.  Returns a dictionary of the searchSymbol() results,
+# or an empty dictionary if the search wasn't worth parallelizing or the 
+# processes couldn't be run, in which case the caller searches serially.
+def searchSymbolsInParallel(symbols, searchPatterns, args):
+    global parallelSearch
+    workers = os.cpu_count() or 1
+    if not worthParallelizing(len(symbols), workers) \
+            or "fork" not in multiprocessing.get_all_start_methods():
+        return {}
+    # Disassemble all of the banks needed beforehand, so that the forked
+    # processes don't each do so.
+    specialSubroutines, bankTables, intpretOperands, core, \
+        disassembleBasic, disassembleInterpretive, interpretiveStart, \
+        bankList = args
+    for symbol in symbols:
+        for searchPattern in searchPatterns[symbol]:
+            banks = [searchRange[0] for searchRange in searchPattern["ranges"]]
+            if len(banks) == 0:
+                banks = bankList
+            for bank in banks:
+                if bank not in bankTables:
+                    bankTables[bank] = disassembleBank(core[bank], 
+                                                       disassembleBasic)
+    parallelSearch = (searchPatterns, args)
+    found = {}
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, 
+                mp_context=multiprocessing.get_context("fork")) as executor:
+            results = executor.map(parallelSearchSymbol, symbols, 
+                    chunksize=max(1, len(symbols) // (4 * workers)))
+            for symbol, (result, matchFixedFixed) in zip(symbols, results):
+                if result[0] != -1:
+                    result = result[:3] \
+                             + (searchPatterns[symbol][result[3]],) \
+                             + result[4:]
+                found[symbol] = (result, matchFixedFixed)
+    except (OSError, concurrent.futures.process.BrokenProcessPool):
+        # fork() failed, or a process died.
+        return {}
+    finally:
+        parallelSearch = None
+    return found
+
 # Search for all of the special patterns, a la those in 
 # searchSpecial.py and searchSpecialBlockI.py.  The 
 # disassembleBasic parameter is the name of the disassembler
-# function to be used.
-import sys
-specialSubroutines = {}
+# function to be used.  Returns the dictionary of special subroutines
+# described at the top of this file.
 def searchSpecial(core, searchPatterns, disassembleBasic, 
                     disassembleInterpretive, interpretiveStart, bankList):
-    global specialSubroutines
+    specialSubroutines = {}
     INTPRET = "no"
+    intpretOperands = (operandId(INTPRET), operandId("INTPRET"))
+    # Basic disassemblies of the banks searched, as returned by 
+    # disassembleBank().  Each bank is disassembled once, the first time
+    # it's needed, since otherwise the same word is disassembled over and
+    # over again, for every pattern and every starting offset whose matching
+    # reaches it.  (Matching all of the patterns simultaneously, a la 
+    # Aho-Corasick, isn't workable:  the optional pattern steps match 
+    # greedily, and symbols found earlier alter both the search ranges and
+    # the operands of the patterns for symbols found later.)
+    bankTables = {}
+    # Also index the pattern steps by the special symbols they use as 
+    # operands, as a dictionary of lists of (searchPattern, step index, 
+    # operand index).  Only the first appearance of a symbol in any given 
+    # step is indexed.
+    operandRefs = {}
     for symbol in searchPatterns:
-        specialSubroutines[symbol] = (-1, -1, -1, {}, symbol, 0) # Mark as not found.
-        found = False
         for searchPattern in searchPatterns[symbol]:
-            if found:
-                break
-            pattern = searchPattern["pattern"]
-            ranges = searchPattern["ranges"]
-            if "basic" not in searchPattern:
-                startBasic = True
-            else:
-                startBasic = searchPattern["basic"]
-            if len(ranges) == 0:
-                ranges = []
-                for bank in bankList:
-                    ranges.append([bank, 0o0000, 0o2000])
-            for searchRange in ranges:
-                if symbol == "no":
-                    print(symbol)
-                    print(pattern)
-                    print(searchRange)
-                if found:
-                    break
-                bank = searchRange[0]
-                startingOffset = searchRange[1]
-                # Usually searchRange[1] is a number, but if it's a string,
-                # then it's the name of a special symbol whose pattern, we
-                # fear, will unfortunately match the symbol we're now trying
-                # to find.  BANKCALL and IBNKCALL have that relationship.
-                # In that case, we adjust the starting range accordingly to
-                # avoid that.  This only works if the 2nd symbol we're 
-                # searching for is at a higher offset than the 1st symbol 
-                # we already found.
-                if startingOffset in specialSubroutines:
-                    startingOffset = specialSubroutines[startingOffset][1] + 1
-                endingOffset = searchRange[2]
-                for testOffset in range(startingOffset, endingOffset):
-                    if found:
-                        break
-                    basic = startBasic
-                    if not basic:
-                        state = interpretiveStart()
-                    iPat = 0 # Index into the pattern.
-                    # Optional opcodes at the beginning of the pattern
-                    # we can ignore for now, because they don't affect
-                    # the match at all.  But we'll come back to them
-                    # at the end if there has been a match, because
-                    # they'll affect the address assigned to the symbol.
-                    while not pattern[iPat][0]: 
-                        iPat += 1
-                    offset = testOffset
-                    extended = False
-                    lastOffset = -1
-                    if symbol == "no":
-                        print("------------------")
-                    
-                    test = False
-                    if False and bank == 0o16 and testOffset == 0o3740 - 0o2000 and \
-                            symbol == "U%02o,%04o" % (bank, testOffset + 0o2000):
-                        test = True
-                            
-                    while offset < endingOffset and iPat < len(pattern):
-                        if basic:
-                            # We need to disassemble the instruction at the current
-                            # offset, but we don't need to do that if the offset
-                            # hasn't changed since the last time we disassembled.  
-                            # More importantly, we must *not* do so, because the 
-                            # value of 'extended' may change if we do, and a 2nd
-                            # disassembly may therefore not be correct.
-                            if offset != lastOffset:
-                                opcode, operand, extended = \
-                                    disassembleBasic(core[bank][offset], extended)
-                            if test:
-                                print("U%02o,%04o: basic=%r, opcode=%s, operand=%s" % \
-                                        (bank, offset+0o2000, basic, opcode, operand), 
-                                        file=sys.stderr)
-                            lastOffset = offset
-                            required = pattern[iPat][0]
-                            desiredOpcodes = pattern[iPat][1]
-                            desiredOperands = pattern[iPat][2]
-                            if len(desiredOpcodes) == 0 or opcode in desiredOpcodes:
-                                if len(desiredOperands) == 0 \
-                                        or operand in desiredOperands:
-                                    iPat += 1
-                                    offset += 1
-                                    if operand == INTPRET:
-                                        operand = "INTPRET"
-                                    if opcode == "TC" and operand == "INTPRET":
-                                        basic = False
-                                        state = interpretiveStart()
-                                    continue
-                            if required:
-                                break
-                            iPat += 1 # Note: offset does not increment.
-                        else: # interpretive.
-                            # For interpretive code, we can't really handle 
-                            # too many alternatives because of the fact
-                            # that only complete "equations" (or "strings")
-                            # of lines can be meaningfully disassembled,
-                            # as opposed to individual words.
-                            disassembly, basic = \
-                                disassembleInterpretive(core, bank, offset, state)
-                            match = True
-                            for d in disassembly:
-                                left = d[0]
-                                right = d[1]
-                                if test:
-                                    print("U%02o,%04o: basic=%r, left=%s, right=%s" % \
-                                            (bank, offset+0o2000, basic, left, right), 
-                                            file=sys.stderr)
-                                if right == "":
-                                    right = d[2]
-                                desiredLeft = pattern[iPat][1]
-                                desiredRight = pattern[iPat][2]
-                                if len(desiredLeft) == 0 or left in desiredLeft:
-                                    if len(desiredRight) == 0 or right in desiredRight:
-                                        iPat += 1
-                                        offset += 1
-                                        continue
-                                match = False
-                                break
-                            if not match:
-                                break
-                    if iPat >= len(pattern):
-                        # At this point, we know that the pattern has been
-                        # found at bank,testOffset.  However, if there were
-                        # optional matches at the beginning of the pattern,
-                        # those haven't been checked, so we have to check 
-                        # those in case testOffset needs to be decremented.
-                        fixedFixed = -1
-                        if bank in [2, 3]:
-                            fixedFixed = bank * 0o2000 + testOffset
-                        specialSubroutines[symbol] = (bank, testOffset, 
-                                                      fixedFixed, searchPattern,
-                                                      symbol, 
-                                                      searchPattern["dataWords"])
-                        if symbol == "INTPRET":
-                            INTPRET = "%04o" % fixedFixed
-                        iPat = 0
-                        while not pattern[iPat][0]: 
-                            iPat += 1
-                        offset = testOffset
-                        while iPat > 0 and offset > startingOffset:
-                            iPat -= 1
-                            offset -= 1
-                            desiredOpcodes = pattern[iPat][1]
-                            desiredOperands = pattern[iPat][2]
-                            opcode, operand, extended = \
-                                disassembleBasic(core[bank][offset], False)
-                            if opcode in desiredOpcodes:
-                                if len(desiredOperands) == 0 \
-                                        or operand in desiredOperands:
-                                    # testOffset -= 1
-                                    fixedFixed = -1
-                                    if bank in [2, 3]:
-                                        fixedFixed = bank * 0o2000 + offset
-                                    specialSubroutines[symbol] = \
-                                        (bank, offset, fixedFixed, 
-                                         searchPattern, symbol, 
-                                         searchPattern["pattern"])
-                                    continue
-                                else: # Does not match!
-                                    break
-                        found = True
-        if found and specialSubroutines[symbol][2] != -1:
+            compilePattern(searchPattern)
+            for i, p in enumerate(searchPattern["pattern"]):
+                for j, operand in enumerate(p[2]):
+                    if operand in searchPatterns and operand not in p[2][:j]:
+                        if operand not in operandRefs:
+                            operandRefs[operand] = []
+                        operandRefs[operand].append((searchPattern, i, j))
+    # The symbols are searched for in order, since each symbol found may 
+    # affect the searches for later ones.  However, the symbols which don't 
+    # refer to any others can be searched for all at once, in parallel, 
+    # as soon as INTPRET (whose location affects all matching of basic code)
+    # has been found.
+    symbols = list(searchPatterns)
+    if "INTPRET" in symbols:
+        parallelStart = symbols.index("INTPRET") + 1
+    else:
+        parallelStart = 0
+    precomputed = {}
+    for position, symbol in enumerate(symbols):
+        if position == parallelStart:
+            independent = [s for s in symbols[position:] \
+                           if not refersToSymbols(searchPatterns[s], 
+                                                  searchPatterns)]
+            precomputed = searchSymbolsInParallel(independent, searchPatterns,
+                (specialSubroutines, bankTables, intpretOperands, core,
+                 disassembleBasic, disassembleInterpretive, 
+                 interpretiveStart, bankList))
+        if symbol in precomputed:
+            result, matchFixedFixed = precomputed[symbol]
+        else:
+            result, matchFixedFixed = searchSymbol(symbol, 
+                searchPatterns[symbol], specialSubroutines, bankTables,
+                intpretOperands, core, disassembleBasic, 
+                disassembleInterpretive, interpretiveStart, bankList)
+        specialSubroutines[symbol] = result
+        if symbol == "INTPRET" and result[0] != -1:
+            INTPRET = "%04o" % matchFixedFixed
+            intpretOperands = (operandId(INTPRET), operandId("INTPRET"))
+        if specialSubroutines[symbol][2] != -1:
             # A numerical address for the symbol has been found in fixed-fixed.
             # If any of these symbols were used in the patterns for operands,
             # we need to replace them by their numerical values for subsequent
             # searching.
-            for s in searchPatterns:
-                for searchPattern in searchPatterns[s]:
-                    pattern = searchPattern["pattern"]
-                    for p in pattern:
-                        ops = p[2]
-                        if symbol in ops:
-                            ops[ops.index(symbol)] = "%04o" % \
-                                            specialSubroutines[symbol][2]
-                            
+            for searchPattern, i, j in operandRefs.pop(symbol, []):
+                ops = searchPattern["pattern"][i][2]
+                ops[j] = "%04o" % specialSubroutines[symbol][2]
+                searchPattern["operands"][i] = \
+                    frozenset(operandId(o) for o in ops)
+    return specialSubroutines
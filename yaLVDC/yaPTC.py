@@ -261,130 +261,42 @@ def eventHalt(event):
 	halt = True
 	indicatorOn(event.widget)
 
+# The PROG REG A and PROG REG B switches, from the sign (most-significant) bit
+# down to bit 25 (least-significant), correspond to these suffixes of the
+# names of the tkinter variables in ProcessorDisplayPanel_support.  The 
+# tuples of the variables' (bound) get methods, praGets and prbGets, are 
+# filled in after the GUI is created.
+progRegSuffixes = ("S",) + tuple(str(i) for i in range(1, 26))
+praGets = ()
+prbGets = ()
+
+# Packs the settings of a row of switches into an integer.  The gets 
+# parameter is a tuple of the switch variables' bound get methods (praGets
+# or prbGets), most-significant bit first.  The settings are treated as the 
+# digits (ASCII '0' or '1') of a binary number, so that the bits are 
+# assembled by int() rather than one at a time.
+def progRegValue(gets):
+	return int(bytes(0x30 + bool(get()) for get in gets), 2)
+
 ProgRegA = -1
 def cPRA():
 	global ProgRegA
-	n = 0
-	if ProcessorDisplayPanel_support.bPRAS.get():
-		n |= 0o200000000
-	if ProcessorDisplayPanel_support.bPRA1.get():
-		n |= 0o100000000
-	if ProcessorDisplayPanel_support.bPRA2.get():
-		n |= 0o040000000
-	if ProcessorDisplayPanel_support.bPRA3.get():
-		n |= 0o020000000
-	if ProcessorDisplayPanel_support.bPRA4.get():
-		n |= 0o010000000
-	if ProcessorDisplayPanel_support.bPRA5.get():
-		n |= 0o004000000
-	if ProcessorDisplayPanel_support.bPRA6.get():
-		n |= 0o002000000
-	if ProcessorDisplayPanel_support.bPRA7.get():
-		n |= 0o001000000
-	if ProcessorDisplayPanel_support.bPRA8.get():
-		n |= 0o000400000
-	if ProcessorDisplayPanel_support.bPRA9.get():
-		n |= 0o000200000
-	if ProcessorDisplayPanel_support.bPRA10.get():
-		n |= 0o000100000
-	if ProcessorDisplayPanel_support.bPRA11.get():
-		n |= 0o000040000
-	if ProcessorDisplayPanel_support.bPRA12.get():
-		n |= 0o000020000
-	if ProcessorDisplayPanel_support.bPRA13.get():
-		n |= 0o000010000
-	if ProcessorDisplayPanel_support.bPRA14.get():
-		n |= 0o000004000
-	if ProcessorDisplayPanel_support.bPRA15.get():
-		n |= 0o000002000
-	if ProcessorDisplayPanel_support.bPRA16.get():
-		n |= 0o000001000
-	if ProcessorDisplayPanel_support.bPRA17.get():
-		n |= 0o000000400
-	if ProcessorDisplayPanel_support.bPRA18.get():
-		n |= 0o000000200
-	if ProcessorDisplayPanel_support.bPRA19.get():
-		n |= 0o000000100
-	if ProcessorDisplayPanel_support.bPRA20.get():
-		n |= 0o000000040
-	if ProcessorDisplayPanel_support.bPRA21.get():
-		n |= 0o000000020
-	if ProcessorDisplayPanel_support.bPRA22.get():
-		n |= 0o000000010
-	if ProcessorDisplayPanel_support.bPRA23.get():
-		n |= 0o000000004
-	if ProcessorDisplayPanel_support.bPRA24.get():
-		n |= 0o000000002
-	if ProcessorDisplayPanel_support.bPRA25.get():
-		n |= 0o000000001
-	ProgRegA = n
+	ProgRegA = progRegValue(praGets)
 ProcessorDisplayPanel_support.cPRA = cPRA
 	
 ProgRegB = -1
 def cPRB():
 	global ProgRegB
-	n = 0
-	if ProcessorDisplayPanel_support.bPRBS.get():
-		n |= 0o200000000
-	if ProcessorDisplayPanel_support.bPRB1.get():
-		n |= 0o100000000
-	if ProcessorDisplayPanel_support.bPRB2.get():
-		n |= 0o040000000
-	if ProcessorDisplayPanel_support.bPRB3.get():
-		n |= 0o020000000
-	if ProcessorDisplayPanel_support.bPRB4.get():
-		n |= 0o010000000
-	if ProcessorDisplayPanel_support.bPRB5.get():
-		n |= 0o004000000
-	if ProcessorDisplayPanel_support.bPRB6.get():
-		n |= 0o002000000
-	if ProcessorDisplayPanel_support.bPRB7.get():
-		n |= 0o001000000
-	if ProcessorDisplayPanel_support.bPRB8.get():
-		n |= 0o000400000
-	if ProcessorDisplayPanel_support.bPRB9.get():
-		n |= 0o000200000
-	if ProcessorDisplayPanel_support.bPRB10.get():
-		n |= 0o000100000
-	if ProcessorDisplayPanel_support.bPRB11.get():
-		n |= 0o000040000
-	if ProcessorDisplayPanel_support.bPRB12.get():
-		n |= 0o000020000
-	if ProcessorDisplayPanel_support.bPRB13.get():
-		n |= 0o000010000
-	if ProcessorDisplayPanel_support.bPRB14.get():
-		n |= 0o000004000
-	if ProcessorDisplayPanel_support.bPRB15.get():
-		n |= 0o000002000
-	if ProcessorDisplayPanel_support.bPRB16.get():
-		n |= 0o000001000
-	if ProcessorDisplayPanel_support.bPRB17.get():
-		n |= 0o000000400
-	if ProcessorDisplayPanel_support.bPRB18.get():
-		n |= 0o000000200
-	if ProcessorDisplayPanel_support.bPRB19.get():
-		n |= 0o000000100
-	if ProcessorDisplayPanel_support.bPRB20.get():
-		n |= 0o000000040
-	if ProcessorDisplayPanel_support.bPRB21.get():
-		n |= 0o000000020
-	if ProcessorDisplayPanel_support.bPRB22.get():
-		n |= 0o000000010
-	if ProcessorDisplayPanel_support.bPRB23.get():
-		n |= 0o000000004
-	if ProcessorDisplayPanel_support.bPRB24.get():
-		n |= 0o000000002
-	if ProcessorDisplayPanel_support.bPRB25.get():
-		n |= 0o000000001
-	ProgRegB = n
+	ProgRegB = progRegValue(prbGets)
 ProcessorDisplayPanel_support.cPRB = cPRB
 
 # This function is automatically called periodically by the event loop to check for 
 # conditions that will result in sending messages to yaLVDC that are interpreted
 # as changes to bits on its input channels.  The return
-# value is supposed to be a list of 4-tuples of the form
-#	[ (ioType0,channel0,value0,mask0), (ioType1,channel1,value1,mask1), ...]
-# and may be an empty list.  The "values" are written to the LVDC/PTC's input "channels",
+# value is supposed to be a tuple of 4-tuples of the form
+#	( (ioType0,channel0,value0,mask0), (ioType1,channel1,value1,mask1), ...)
+# and is usually the empty tuple, which unlike an empty list costs nothing to 
+# create.  The "values" are written to the LVDC/PTC's input "channels",
 # while the "masks" tell which bits of the "values" are valid.  The ioTypeN's are
 # indices into ioTypes[] (see top of file) to tell which particular class of i/o
 # channels is affected.  Only the PIO, CIO, and INT classes are possible for inputs
@@ -396,15 +308,14 @@ displayModePayload = -1
 needStatusFromCPU = False
 nomask = 0o377777777
 def inputsForCPU():
-	#global delayCount, ioTypeCount, channelCount
 	global ProgRegA, ProgRegB, resetMachine, halt, needStatusFromCPU
 	global changedIA, changedDA, changedD, displayModePayload, advance
 	global newConnect
-	returnValue = []
+	returnValue = ()
 	
 	if newConnect:
-		returnValue.append((4, 0o606, typewriterMargin, nomask))
-		returnValue.append((4, 0o607, typewriterTabStop, nomask))
+		returnValue += ((4, 0o606, typewriterMargin, nomask),
+				(4, 0o607, typewriterTabStop, nomask))
 		newConnect = False
 	
 	if ProgRegA != -1:
@@ -414,69 +325,65 @@ def inputsForCPU():
 		# and typewriter busy) are simulated directly in yaLVDC,
 		# due to timing considerations, and hence have to be masked
 		# off.
-		returnValue.append((1, 0o214, n, nomask & ~7))
+		returnValue += ((1, 0o214, n, nomask & ~7),)
 
 	if ProgRegB != -1:
 		n = ProgRegB
 		ProgRegB = -1
-		returnValue.append((1, 0o220, n, nomask))
+		returnValue += ((1, 0o220, n, nomask),)
 	
 	if resetMachine:
 		resetMachine = False
-		returnValue.append((4, 0o604, 0, nomask))
+		returnValue += ((4, 0o604, 0, nomask),)
 	
 	if halt:
 		halt = False
-		returnValue.append((4, 0o000, 0, nomask))
+		returnValue += ((4, 0o000, 0, nomask),)
 	
 	if changedIA != -1:
-		returnValue.append((4, 0o003, changedIA, nomask))
+		returnValue += ((4, 0o003, changedIA, nomask),)
 		changedIA = -1
 
 	if changedDA != -1:
-		returnValue.append((4, 0o002, changedDA, nomask))
+		returnValue += ((4, 0o002, changedDA, nomask),)
 		changedDA = -1
 
 	if changedD != -1:
-		returnValue.append((4, 0o004, changedD, nomask))
+		returnValue += ((4, 0o004, changedD, nomask),)
 		changedD = -1
 
 	if displayModePayload != -1:
-		returnValue.append((4, 0o005, displayModePayload, nomask))
+		returnValue += ((4, 0o005, displayModePayload, nomask),)
 		displayModePayload = -1
 
 	if advance:
 		advance = False
 		if modeControl >= 2:
-			returnValue.append((4, 0o001, 0, nomask))
+			returnValue += ((4, 0o001, 0, nomask),)
 		elif modeControl == 1:
-			returnValue.append((4, 0o603, 0, nomask))
+			returnValue += ((4, 0o603, 0, nomask),)
 		elif modeControl == 0:
-			returnValue.append((4, 0o604, 0, nomask))
-			returnValue.append((4, 0o001, 0, nomask))
+			returnValue += ((4, 0o604, 0, nomask), (4, 0o001, 0, nomask))
 
 	if needStatusFromCPU:
 		needStatusFromCPU = False
-		returnValue.append((4, 0o605, 0, nomask))
+		returnValue += ((4, 0o605, 0, nomask),)
 	
 	return returnValue
 
 # GUI indicator functions.  These are implemented as canvas widgets,
 # sometimes with callback functions bound to them when they're supposed
-# to act like pushbuttons.  Each canvas just has two visible elements:
-# a filling white rectangle (ID=1) that can be either opaque or invisible,
-# and a textual caption (ID=5).
+# to act like pushbuttons.  Each canvas just has one element, a textual
+# caption (ID=1), and is lit by changing its background color to white.
 # Adjust the size of an indicator lamp after a startup, window resize, etc.
 def indicatorReconfigure(event):
 	width = event.width
 	height = event.height
-	event.widget.coords(1, 0, 0, width, height)
-	event.widget.coords(2, width/2.0, height/2.0)
+	event.widget.coords(1, width/2.0, height/2.0)
 # Set up an indicator lamp, at startup, before use.  As defined by the PAGE
 # tool, and our import of the modules it creates, an indicator lamp is simply
-# an empty rectangular canvas.  We add two elements to the canvas:  a 
-# rectangular block that fills it, and which we can use to adjust the color 
-# by either revealing it or hiding it, and above that, the textual caption.
+# an empty rectangular canvas.  We add the textual caption to the canvas, 
+# and remember the canvas's original background color as its unlit color.
 PANEL_PDP = 1	# PANEL_XXX is just a constant we use to ID specific panels.
 PANEL_MLDD = 2
 PANEL_CE = 3
@@ -486,19 +393,25 @@ CC_COMMAND = 2
 indicators = { PANEL_PDP : {}, PANEL_MLDD : {}, PANEL_CE : {} }
 computerIndicators = []
 commandIndicators = []
+# The visible state of each indicator, "normal" (lit) or "hidden" (unlit),
+# kept here so that it needn't be queried from tkinter, and the unlit 
+# background color of each indicator.
+indicatorStates = {}
+indicatorOffColors = {}
 def indicatorInitialize(canvas, text, panel, cc = CC_NONE):
 	indicators[panel][canvas] = 0
+	indicatorStates[canvas] = "hidden"
+	indicatorOffColors[canvas] = canvas.cget("background")
 	if cc == CC_COMPUTER:
 		computerIndicators.append(canvas)
 	elif cc == CC_COMMAND:
 		commandIndicators.append(canvas)
 	canvas.delete("all")
-	canvas.create_rectangle(0, 0, 1, 1, fill="white", state = "hidden")
 	canvas.create_text(1, 1, fill="white", text=text, font=("Sans", 6), justify=tk.CENTER)
 	canvas.bind("<Configure>", indicatorReconfigure)
 # indicatorOn() and indicatorOff() are used to either light up an indicator
-# or to unlight it.  That involves changing the color of the rectangular
-# fill and the text-color of the caption.  However, we have to intercept
+# or to unlight it.  That involves changing the background color of the 
+# canvas and the text-color of the caption.  However, we have to intercept
 # that process if a LAMP TEST is in progress for the particular panel 
 # containing the indicator, because in that case we have to capture the
 # intended change of state but not change the actual colors, since when 
@@ -509,8 +422,7 @@ def indicatorInitialize(canvas, text, panel, cc = CC_NONE):
 # tracks those changes; it not only indicates which indicators are on which
 # of the 3 panels, but also tracks their intended states during LAMP TESTS;
 # it doesn't try to track their states whilst there is no LAMP TEST for the
-# corresponding panel, because the configuration attributes of the canvases'
-# elements do that already.
+# corresponding panel, because indicatorStates[] does that already.
 inLampTests = []
 def isIndicatorInLampTest(canvas):
 	for panel in inLampTests:
@@ -520,9 +432,10 @@ def isIndicatorInLampTest(canvas):
 def indicatorOff(canvas):
 	inTest = isIndicatorInLampTest(canvas)
 	if inTest == False:
-		if canvas.itemcget(1, "state") == "normal":
-			canvas.itemconfig(1, state = "hidden")
-			canvas.itemconfig(2, fill = "white")
+		if indicatorStates.get(canvas) == "normal":
+			indicatorStates[canvas] = "hidden"
+			canvas.configure(background = indicatorOffColors[canvas])
+			canvas.itemconfig(1, fill = "white")
 			if canvas in commandIndicators:
 				indicatorToggle(top.mlddPARITY_BIT)
 	else:
@@ -533,9 +446,10 @@ def indicatorOff(canvas):
 def indicatorOn(canvas):
 	inTest = isIndicatorInLampTest(canvas)
 	if inTest == False:
-		if canvas.itemcget(1, "state") == "hidden":
-			canvas.itemconfig(1, state = "normal")
-			canvas.itemconfig(2, fill = "black")
+		if indicatorStates.get(canvas) == "hidden":
+			indicatorStates[canvas] = "normal"
+			canvas.configure(background = "white")
+			canvas.itemconfig(1, fill = "black")
 			if canvas in commandIndicators:
 				indicatorToggle(top.mlddPARITY_BIT)
 	else:
@@ -552,14 +466,14 @@ def indicatorSet(canvas, onOff):
 def indicatorToggle(canvas):
 	inTest = isIndicatorInLampTest(canvas)
 	if inTest == False:
-		indicatorSet(canvas, canvas.itemcget(1, "state") == "hidden")
+		indicatorSet(canvas, indicatorStates.get(canvas) == "hidden")
 	else:
 		indicatorSet(canvas, indicators[inTest][canvas] == "hidden")
 
 def startPanelLampTest(panel):
 	for indicator in indicators[panel]:
-		#print(indicator.itemcget(2, "text"))
-		indicators[panel][indicator] = indicator.itemcget(1, "state")
+		#print(indicator.itemcget(1, "text"))
+		indicators[panel][indicator] = indicatorStates[indicator]
 		indicatorOn(indicator)
 	# The SERIALIZER PARITY BIT has to be lit last (although
 	# it may already have been lit above), since the subsequent
@@ -592,57 +506,57 @@ def endPanelLampTest(panel):
 # of MLDD into an integer.		
 def getDataCommand():
 	value = 0;			
-	if top.mlddCommandSIGN.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommandSIGN] == "normal":
 		value |= 0o200000000
-	if top.mlddCommand1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand1] == "normal":
 		value |= 0o100000000
-	if top.mlddCommand2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand2] == "normal":
 		value |= 0o040000000
-	if top.mlddCommand3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand3] == "normal":
 		value |= 0o020000000
-	if top.mlddCommand4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand4] == "normal":
 		value |= 0o010000000
-	if top.mlddCommand5.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand5] == "normal":
 		value |= 0o004000000
-	if top.mlddCommand6.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand6] == "normal":
 		value |= 0o002000000
-	if top.mlddCommand7.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand7] == "normal":
 		value |= 0o001000000
-	if top.mlddCommand8.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand8] == "normal":
 		value |= 0o000400000
-	if top.mlddCommand9.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand9] == "normal":
 		value |= 0o000200000
-	if top.mlddCommand10.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand10] == "normal":
 		value |= 0o000100000
-	if top.mlddCommand11.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand11] == "normal":
 		value |= 0o000040000
-	if top.mlddCommand12.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand12] == "normal":
 		value |= 0o000020000
-	if top.mlddCommand13.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand13] == "normal":
 		value |= 0o000010000
-	if top.mlddCommand14.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand14] == "normal":
 		value |= 0o000004000
-	if top.mlddCommand15.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand15] == "normal":
 		value |= 0o000002000
-	if top.mlddCommand16.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand16] == "normal":
 		value |= 0o000001000
-	if top.mlddCommand17.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand17] == "normal":
 		value |= 0o000000400
-	if top.mlddCommand18.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand18] == "normal":
 		value |= 0o000000200
-	if top.mlddCommand19.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand19] == "normal":
 		value |= 0o000000100
-	if top.mlddCommand20.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand20] == "normal":
 		value |= 0o000000040
-	if top.mlddCommand21.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand21] == "normal":
 		value |= 0o000000020
-	if top.mlddCommand22.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand22] == "normal":
 		value |= 0o000000010
-	if top.mlddCommand23.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand23] == "normal":
 		value |= 0o000000004
-	if top.mlddCommand24.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand24] == "normal":
 		value |= 0o000000002
-	if top.mlddCommand25.itemcget(1, "state") == "normal":
+	if indicatorStates[top.mlddCommand25] == "normal":
 		value |= 0o000000001
 	return value
 			
@@ -655,45 +569,45 @@ def indicatorDataCommandParity():
 # of MLDD into an integer.		
 def getDataAddressCommand():
 	value = 0;			
-	if top.daCommandDS4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandDS4] == "normal":
 		value |= 0o040000000
-	if top.daCommandDS3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandDS3] == "normal":
 		value |= 0o020000000
-	if top.daCommandDS2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandDS2] == "normal":
 		value |= 0o010000000
-	if top.daCommandDS1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandDS1] == "normal":
 		value |= 0o004000000
 
-	if top.daCommandM1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandM1] == "normal":
 		value |= 0o000400000
 
-	if top.daCommandOA8.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA8] == "normal":
 		value |= 0o000010000
-	if top.daCommandOA7.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA7] == "normal":
 		value |= 0o000004000
-	if top.daCommandOA6.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA6] == "normal":
 		value |= 0o000002000
-	if top.daCommandOA5.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA5] == "normal":
 		value |= 0o000001000
-	if top.daCommandOA4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA4] == "normal":
 		value |= 0o000000400
-	if top.daCommandOA3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA3] == "normal":
 		value |= 0o000000200
-	if top.daCommandOA2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA2] == "normal":
 		value |= 0o000000100
-	if top.daCommandOA1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA1] == "normal":
 		value |= 0o000000040
 		
-	if top.daCommandOA9.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOA9] == "normal":
 		value |= 0o000000020
 		
-	if top.daCommandOP4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOP4] == "normal":
 		value |= 0o000000010
-	if top.daCommandOP3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOP3] == "normal":
 		value |= 0o000000004
-	if top.daCommandOP2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOP2] == "normal":
 		value |= 0o000000002
-	if top.daCommandOP1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.daCommandOP1] == "normal":
 		value |= 0o000000001
 	return value
 			
@@ -701,36 +615,36 @@ def getDataAddressCommand():
 # of MLDD into an integer.	
 def getInstructionAddressCommand():
 	value = 0;			
-	if top.iaCommandM1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandM1] == "normal":
 		value |= 0o200000000
 		
-	if top.iaCommandA8.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA8] == "normal":
 		value |= 0o000040000
-	if top.iaCommandA7.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA7] == "normal":
 		value |= 0o000020000
-	if top.iaCommandA6.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA6] == "normal":
 		value |= 0o000010000
-	if top.iaCommandA5.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA5] == "normal":
 		value |= 0o000004000
-	if top.iaCommandA4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA4] == "normal":
 		value |= 0o000002000
-	if top.iaCommandA3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA3] == "normal":
 		value |= 0o000001000
-	if top.iaCommandA2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA2] == "normal":
 		value |= 0o000000400
-	if top.iaCommandA1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandA1] == "normal":
 		value |= 0o000000200
 		
-	if top.iaCommandSYL1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandSYL1] == "normal":
 		value |= 0o000000100
 		
-	if top.iaCommandIS4.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandIS4] == "normal":
 		value |= 0o000000040
-	if top.iaCommandIS3.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandIS3] == "normal":
 		value |= 0o000000020
-	if top.iaCommandIS2.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandIS2] == "normal":
 		value |= 0o000000010
-	if top.iaCommandIS1.itemcget(1, "state") == "normal":
+	if indicatorStates[top.iaCommandIS1] == "normal":
 		value |= 0o000000004
 	return value
 			
@@ -834,7 +748,7 @@ def getCommandedDataAddress():
 
 def autoAddressCmptr():
 	global changedD
-	if top.trmcML.itemcget(1, "state") == "normal" and top.mlREPEAT.itemcget(1, "state") == "normal":
+	if indicatorStates[top.trmcML] == "normal" and indicatorStates[top.mlREPEAT] == "normal":
 		changedD = getDataCommand()
 		root.after(500, autoAddressCmptr)
 
@@ -846,7 +760,7 @@ def eventRepeat(event):
 
 def eventAddressCmptr(event):
 	global changedD
-	if top.trmcML.itemcget(1, "state") == "normal":
+	if indicatorStates[top.trmcML] == "normal":
 		indicatorOn(event.widget)
 		changedD = getDataCommand()
 
@@ -919,6 +833,41 @@ xDelta = 0
 yDelta = 0
 typewriterCharsInLine = 0
 isRed = False
+
+# Turn indicator lamps on or off.  I think this is actually
+# the full functionality of CIO-204
+def outputCIO204(value):
+	for canvas in lamps204:
+		indicatorSet(canvas, value & 1)
+		value >>= 1
+
+def outputCIO210(value):
+	global crlfCount, typewriterCharsInLine
+	bits = value
+	for canvas in lamps210:
+		indicatorSet(canvas, bits & 1)
+		bits >>= 1
+	if value & 0o1:
+		if crlfCount == 0:
+			printerWindow.text.insert(tk.END, "\n")
+			printerWindow.text.see("end")
+			crlfCount += 1
+	if value & 0o4:
+		typewriterCharsInLine = 0
+		typewriterWindow.text.insert(tk.END, "\n")
+		typewriterWindow.text.see("end")
+		if crlfCount == 0:
+			printerWindow.text.insert(tk.END, "\n")
+			printerWindow.text.see("end")
+			crlfCount += 1
+
+# Outputs which are handled entirely by functions of their own, indexed by
+# (ioType, channel), rather than by the if-chain in outputFromCPU().
+outputHandlers = {
+	(1, 0o204): outputCIO204,
+	(1, 0o210): outputCIO210
+}
+
 def outputFromCPU(ioType, channel, value):
 	global displaySelect, modeControl, addressCompare, dcDisplayCount, crlfCount
 	global prsModeBCD, xPlot, yPlot, penDown, xDelta, yDelta, typewriterCharsInLine
@@ -927,9 +876,14 @@ def outputFromCPU(ioType, channel, value):
 	
 	#print("*", end="")
 	
+	handler = outputHandlers.get((ioType, channel))
+	if handler is not None:
+		handler(value)
+		return
+	
 	if ioType == 0:
 		# PIO
-		print("\nChannel PIO-%03o = %09o" % (channel, value), end="  ")
+		print("\nChannel %s-%03o = %09o" % (ioTypes[ioType], channel, value), end="  ")
 		
 	elif ioType == 1:
 		# CIO
@@ -1069,76 +1023,10 @@ def outputFromCPU(ioType, channel, value):
 				penDown = False
 			elif value & 2:
 				penDown = True
-		elif channel == 0o204:
-			# Turn indicator lamps on or off.  I think this is actually
-			# the full functionality of CIO-204
-			#print("here %d" % value)
-			if value & 0o1:
-				indicatorOn(top.P1)
-			else:
-				indicatorOff(top.P1)
-			if value & 0o2:
-				indicatorOn(top.P2)
-			else:
-				indicatorOff(top.P2)
-			if value & 0o4:
-				indicatorOn(top.P4)
-			else:
-				indicatorOff(top.P4)
-			if value & 0o10:
-				indicatorOn(top.P10)
-			else:
-				indicatorOff(top.P10)
-			if value & 0o20:
-				indicatorOn(top.P20)
-			else:
-				indicatorOff(top.P20)
-			if value & 0o40:
-				indicatorOn(top.P40)
-			else:
-				indicatorOff(top.P40)
-			return
-		elif channel == 0o210:
-			if value & 0o1:
-				indicatorOn(top.D1)
-				if crlfCount == 0:
-					printerWindow.text.insert(tk.END, "\n")
-					printerWindow.text.see("end")
-					crlfCount += 1
-			else:
-				indicatorOff(top.D1)
-			if value & 0o2:
-				indicatorOn(top.D2)
-			else:
-				indicatorOff(top.D2)
-			if value & 0o4:
-				indicatorOn(top.D3)
-				typewriterCharsInLine = 0
-				typewriterWindow.text.insert(tk.END, "\n")
-				typewriterWindow.text.see("end")
-				if crlfCount == 0:
-					printerWindow.text.insert(tk.END, "\n")
-					printerWindow.text.see("end")
-					crlfCount += 1
-			else:
-				indicatorOff(top.D3)
-			if value & 0o10:
-				indicatorOn(top.D4)
-			else:
-				indicatorOff(top.D4)
-			if value & 0o20:
-				indicatorOn(top.D5)
-			else:
-				indicatorOff(top.D5)
-			if value & 0o40:
-				indicatorOn(top.D6)
-			else:
-				indicatorOff(top.D6)
-			return
 		elif channel == 0o240:
 			indicatorOn(top.PROG_ERR)
 		else:
-			print("\nChannel CIO-%03o = %09o" % (channel, value), end="  ")
+			print("\nChannel %s-%03o = %09o" % (ioTypes[ioType], channel, value), end="  ")
 		if see:
 			typewriterWindow.text.see("end")
 	elif ioType == 2:
@@ -1196,7 +1084,7 @@ def outputFromCPU(ioType, channel, value):
 			indicatorSet(top.daComputerOA7, a81 & 64)
 			indicatorSet(top.daComputerOA8, a81 & 128)
 			indicatorSet(top.daPARITY_BIT, oddParity13(value))
-			if top.pdpMEM_ADD_REG.itemcget(1, "state") == "normal":
+			if indicatorStates[top.pdpMEM_ADD_REG] == "normal":
 				indicatorSet(top.pdp1, value & 4096)
 				indicatorSet(top.pdp2, value & 2048)
 				indicatorSet(top.pdp3, value & 1024)
@@ -1264,7 +1152,7 @@ def outputFromCPU(ioType, channel, value):
 			indicatorSet(top.iaComputerA6, loc & 32)
 			indicatorSet(top.iaComputerA7, loc & 64)
 			indicatorSet(top.iaComputerA8, loc & 128)
-			if top.pdpMEM_ADD_REG.itemcget(1, "state") == "normal":
+			if indicatorStates[top.pdpMEM_ADD_REG] == "normal":
 				indicatorSet(top.pdpIM0, not im)
 				indicatorSet(top.pdpIM1, im)
 				indicatorSet(top.pdpSYL0, not s)
@@ -1400,7 +1288,7 @@ def outputFromCPU(ioType, channel, value):
 			indicatorSet(top.pdpHOPSAVE_REG, not memAddReg)
 		elif channel == 0o600:
 			print("ACC = %09o" % value)
-			if top.ACC_DISPLAY_ENABLE.itemcget(1, "state") == "normal":
+			if indicatorStates[top.ACC_DISPLAY_ENABLE] == "normal":
 				indicatorSet(top.DLA26, (value >> 0) & 1)
 				indicatorSet(top.DLA25, (value >> 1) & 1)
 				indicatorSet(top.DLA24, (value >> 2) & 1)
@@ -1519,17 +1407,17 @@ def changeDisplayMode(newDisplaySelect, newModeControl, newAddressCompare, other
 		if addressCompare:
 			displayModePayload |= 1 << 3
 		displayModePayload |= modeControl & 7
-		if top.mlREPEAT.itemcget(1, "state") == "normal":
+		if indicatorStates[top.mlREPEAT] == "normal":
 			displayModePayload |= 1 << 6
-		if top.CST.itemcget(1, "state") == "normal":
+		if indicatorStates[top.CST] == "normal":
 			displayModePayload |= 1 << 7
-		if top.MAN_CST.itemcget(1, "state") == "normal":
+		if indicatorStates[top.MAN_CST] == "normal":
 			displayModePayload |= 1 << 8
-		if top.trmcML.itemcget(1, "state") == "normal":
+		if indicatorStates[top.trmcML] == "normal":
 			displayModePayload |= 1 << 9
-		if top.ACC_DISPLAY_ENABLE.itemcget(1, "state") == "normal":
+		if indicatorStates[top.ACC_DISPLAY_ENABLE] == "normal":
 			displayModePayload |= 1 << 10
-		if top.pdpMEM_ADD_REG.itemcget(1, "state") == "normal":
+		if indicatorStates[top.pdpMEM_ADD_REG] == "normal":
 			displayModePayload |= 1 << 11
 		
 def eventDisplaySelect():
@@ -1547,6 +1435,7 @@ ProcessorDisplayPanel_support.eventModeControl = eventModeControl
 
 import time
 import socket
+import struct
 
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 s.setblocking(0)
@@ -1582,115 +1471,144 @@ connectToAGC()
 # unless there are bugs.
 
 # Given a 4-tuple (ioType,channel,value,mask), creates packet data and sends it to yaLVDC.
+# If there's a mask, its packet and the value's packet are sent together.  Since
+# the socket is non-blocking, s.send() may accept only part of the data (or 
+# none of it) if the socket's send buffer is full.  Whatever isn't accepted
+# is kept in pendingOutput, ahead of any later packets, and flushOutput()
+# retries it on each pass through mainLoopIteration().
+packetStruct = struct.Struct(">6B")
+outputBuffer = bytearray(2 * packetStruct.size)
+pendingOutput = bytearray()
+def flushOutput():
+	if len(pendingOutput) > 0:
+		try:
+			del pendingOutput[: s.send(pendingOutput)]
+		except BlockingIOError:
+			pass
 def packetize(tuple):
-	outputBuffer = bytearray(6)
-	source = ID
-	ioType = tuple[0]
-	channel = tuple[1]
-	value = tuple[2]
-	mask = tuple[3]
+	ioType, channel, value, mask = tuple
+	header = 0x80 | ((ioType & 7) << 3) | (ID & 7)
+	channelLow = channel & 0x7F
+	channelHigh = (channel & 0x180) >> 2
 	if mask != 0o377777777:
-		outputBuffer[0] = 0x80 | 0x40 | ((ioType & 7) << 3) | (ID & 7)
-		outputBuffer[1] = channel & 0x7F
-		outputBuffer[2] = ((channel & 0x180) >> 2) | ((mask >> 21) & 0x1F)
-		outputBuffer[3] = (mask >> 14) & 0x7F
-		outputBuffer[4] = (mask >> 7) & 0x7F
-		outputBuffer[5] = mask & 0x7F
-		s.send(outputBuffer)
-	outputBuffer[0] = 0x80 | ((ioType & 7) << 3) | (ID & 7)
-	outputBuffer[1] = channel & 0x7F
-	outputBuffer[2] = ((channel & 0x180) >> 2) | ((value >> 21) & 0x1F)
-	outputBuffer[3] = (value >> 14) & 0x7F
-	outputBuffer[4] = (value >> 7) & 0x7F
-	outputBuffer[5] = value & 0x7F
-	s.send(outputBuffer)
-
-# Buffer for a packet received from yaLVDC.
+		packetStruct.pack_into(outputBuffer, 0, header | 0x40, channelLow,
+			channelHigh | ((mask >> 21) & 0x1F), (mask >> 14) & 0x7F,
+			(mask >> 7) & 0x7F, mask & 0x7F)
+		start = 0
+	else:
+		start = packetStruct.size
+	packetStruct.pack_into(outputBuffer, packetStruct.size, header, 
+		channelLow, channelHigh | ((value >> 21) & 0x1F), 
+		(value >> 14) & 0x7F, (value >> 7) & 0x7F, value & 0x7F)
+	data = memoryview(outputBuffer)[start:]
+	if len(pendingOutput) == 0:
+		try:
+			data = data[s.send(data):]
+		except BlockingIOError:
+			pass
+	pendingOutput.extend(data)
+
+# Buffer for packets received from yaLVDC.  As many bytes as are available
+# are read at once, and all of the complete packets among them are processed,
+# with any partial packet left at the front of the buffer for next time.
 packetSize = 6
-inputBuffer = bytearray(packetSize)
-leftToRead = packetSize
-view = memoryview(inputBuffer)
+inputBuffer = bytearray(4096)
+inputView = memoryview(inputBuffer)
+inputLength = 0
+
+# Where tkinter supports it (i.e., other than on Windows), the socket is read
+# only when tkinter's event loop finds data waiting on it, rather than being
+# polled by mainLoopIteration(), and mainLoopIteration() then needn't run as
+# often.
+socketEvents = False
+inputRefreshRate = 20 # Milliseconds, when socketEvents is True.
 
 didSomething = False
-def mainLoopIteration():
-	global didSomething, inputBuffer, leftToRead, view
+def readFromCPU():
+	global didSomething, inputLength, socketEvents
 
 	# Check for packet data received from yaLVDC and process it.
-	# While these packets are always exactly 5
+	# While these packets are always exactly 6
 	# bytes long, since the socket is non-blocking, any individual read
 	# operation may yield less bytes than that, so the buffer may accumulate data
 	# over time until it fills.	
 	try:
-		numNewBytes = s.recv_into(view, leftToRead)
+		numNewBytes = s.recv_into(inputView[inputLength:])
 	except:
 		numNewBytes = 0
-	if numNewBytes > 0:
-		view = view[numNewBytes:]
-		leftToRead -= numNewBytes 
-		if leftToRead == 0:
-			# Prepare for next read attempt.
-			view = memoryview(inputBuffer)
-			leftToRead = packetSize
-			# Parse the packet just read, and call outputFromAGx().
-			# Start with a sanity check.
-			ok = 1
-			if (inputBuffer[0] & 0x80) != 0x80:
-				ok = 0
-			elif (inputBuffer[1] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[2] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[3] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[4] & 0x80) != 0x00:
-				ok = 0
-			elif (inputBuffer[5] & 0x80) != 0x00:
-				ok = 0
-			# Packet has the various signatures we expect.
-			if ok == 0:
-				# The protocol allows yaLVDC to send a byte that's 0xFF, 
-				# which is intended as a ping and can be ignored.  I don't
-				# know if there will actually be any such messages.  For 
-				# other corrupted packets we print a message.  In either 
-				# case, we try to realign past the corrupted/ping byte(s).
-				if inputBuffer[0] != 0xff:
-					print("Illegal packet: %03o %03o %03o %03o %03o %03o" % tuple(inputBuffer))
-				for i in range(1,packetSize):
-					if (inputBuffer[i] & 0x80) == 0x80 and inputBuffer[i] != 0xFF:
-						j = 0
-						for k in range(i,6):
-							inputBuffer[j] = inputBuffer[k]
-							j += 1
-						view = view[j:]
-						leftToRead = packetSize - j
+	else:
+		if numNewBytes == 0 and socketEvents:
+			# The connection has been closed, so the socket would be 
+			# readable forever.  Go back to polling it.
+			root.tk.deletefilehandler(s)
+			socketEvents = False
+	inputLength += numNewBytes
+	start = 0
+	while inputLength - start >= packetSize:
+		# Parse the packet at start, and call outputFromCPU().
+		# Start with a sanity check:  only the first byte has its
+		# most-significant bit set.
+		b0, b1, b2, b3, b4, b5 = packetStruct.unpack_from(inputBuffer, start)
+		if (b0 & 0x80) == 0 or ((b1 | b2 | b3 | b4 | b5) & 0x80) != 0:
+			# The protocol allows yaLVDC to send a byte that's 0xFF, 
+			# which is intended as a ping and can be ignored.  I don't
+			# know if there will actually be any such messages.  For 
+			# other corrupted packets we print a message.  In either 
+			# case, we try to realign past the corrupted/ping byte(s).
+			if b0 != 0xff:
+				print("Illegal packet: %03o %03o %03o %03o %03o %03o" % \
+					(b0, b1, b2, b3, b4, b5))
+			for i in range(1, packetSize):
+				if (inputBuffer[start + i] & 0x80) == 0x80 and \
+						inputBuffer[start + i] != 0xFF:
+					break
 			else:
-				ioType = (inputBuffer[0] >> 3) & 7
-				source = inputBuffer[0] & 7
-				channel = ((inputBuffer[2] << 2) & 0x180) | (inputBuffer[1] & 0x7F)
-				value = (inputBuffer[2] & 0x1F) << 21
-				value |= (inputBuffer[3] & 0x7F) << 14
-				value |= (inputBuffer[4] & 0x7F) << 7
-				value |= inputBuffer[5] & 0x7F
-				outputFromCPU(ioType, channel, value)
-			didSomething = True
+				i = packetSize
+			start += i
+		else:
+			# Packet has the various signatures we expect.
+			ioType = (b0 >> 3) & 7
+			channel = ((b2 << 2) & 0x180) | b1
+			value = ((b2 & 0x1F) << 21) | (b3 << 14) | (b4 << 7) | b5
+			start += packetSize
+			outputFromCPU(ioType, channel, value)
+		didSomething = True
+	if start > 0:
+		# Move any partial packet to the front of the buffer.
+		inputView[: inputLength - start] = inputView[start : inputLength]
+		inputLength -= start
+
+def eventSocketReadable(file, mask):
+	readFromCPU()
+
+def mainLoopIteration():
+	global didSomething
+
+	if not socketEvents:
+		readFromCPU()
+	flushOutput()
 	
 	# Check for locally-generated data for which we must generate messages
-	# to yaLVDC over the socket.  In theory, the externalData list could contain
+	# to yaLVDC over the socket.  In theory, the externalData tuple could contain
 	# any number of channel operations, but in practice it will probably contain
 	# only 0 or 1 operations.
 	externalData = inputsForCPU()
-	for i in range(0, len(externalData)):
-		packetize(externalData[i])
+	for data in externalData:
+		packetize(data)
 		didSomething = True
 	
-	root.after(refreshRate, mainLoopIteration)		
+	if socketEvents:
+		root.after(inputRefreshRate, mainLoopIteration)
+	else:
+		root.after(refreshRate, mainLoopIteration)
 	
-while False:
-	mainLoopIteration()
-
 root = tk.Tk()
 
 ProcessorDisplayPanel_support.set_Tk_var()
+praGets = tuple(getattr(ProcessorDisplayPanel_support, "bPRA" + suffix).get \
+		for suffix in progRegSuffixes)
+prbGets = tuple(getattr(ProcessorDisplayPanel_support, "bPRB" + suffix).get \
+		for suffix in progRegSuffixes)
 top = topProcessorDisplayPanel (root)
 ProcessorDisplayPanel_support.init(root, top)
 # Lots and lots of initializations that the PAGE tool wasn't
@@ -1799,6 +1717,10 @@ indicatorInitialize(top.D3, "D3", PANEL_PDP)
 indicatorInitialize(top.D4, "D4", PANEL_PDP)
 indicatorInitialize(top.D5, "D5", PANEL_PDP)
 indicatorInitialize(top.D6, "D6", PANEL_PDP)
+# The lamps set by CIO-204 and CIO-210, controlled by bits 0o1, 0o2, 0o4, ...,
+# 0o40 of the output value, in that order.
+lamps204 = (top.P1, top.P2, top.P4, top.P10, top.P20, top.P40)
+lamps210 = (top.D1, top.D2, top.D3, top.D4, top.D5, top.D6)
 indicatorInitialize(top.RESET_MACHINE, "RESET\nMACHINE", PANEL_PDP)
 indicatorInitialize(top.HALT, "HALT", PANEL_PDP)
 # Indicators for MISCELLANEOUS area (PDP POWER CONTROL and TRMC MODE):
@@ -2195,5 +2117,10 @@ except:
 	pass
 
 root.resizable(resize, resize)
+try:
+	root.tk.createfilehandler(s, tk.READABLE, eventSocketReadable)
+	socketEvents = True
+except (AttributeError, RuntimeError):
+	pass
 root.after(refreshRate, mainLoopIteration)
 root.mainloop()
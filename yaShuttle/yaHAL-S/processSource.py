@@ -103,12 +103,7 @@ def processSource(PALMAT, halsSource, metadata, noCompile=False, lbnf=False,
     # the positioning our compiler output is going to use for error markers, 
     # let's expand all tabs to spaces.
     def untab(line):
-        while "\t" in line:
-            tabAt = line.index('\t')
-            alignTo = tabSize * ((tabAt + tabSize) // tabSize)
-            fmt = "%-" + ("%d" % alignTo) + "s"
-            line = fmt % line[:tabAt] + line[tabAt + 1:]
-        return line
+        return line.expandtabs(tabSize)
         
     for i in range(len(halsSource)):
         halsSource[i] = halsSource[i].replace("¬","~")\
@@ -134,11 +129,15 @@ def processSource(PALMAT, halsSource, metadata, noCompile=False, lbnf=False,
         f = sys.stdout
     else:
         f = open(tmpFile, "w")
-    for i in range(len(halsSource)):
-        if len(halsSource[i]) > 0 and halsSource[i][:1] != " ":
-            print(" /*" + halsSource[i] + "*/", file=f)
+    # The lines are collected and written all at once.
+    lines = []
+    untranslate = reorganizer.untranslate
+    for line in halsSource:
+        if line[:1] not in ("", " "):
+            lines.append(" /*" + line + "*/\n")
         else:
-            print(reorganizer.untranslate(halsSource[i]), file=f)
+            lines.append(untranslate(line) + "\n")
+    f.writelines(lines)
     if not noCompile:
         f.close()
 
@@ -168,9 +168,14 @@ for param in sys.argv[1:]:
     else:
         fileIndex = astSourceFile(PALMAT, param)
         start = len(halsSource)
-        halsFile = open(param, "r")
-        halsSource += halsFile.readlines()
-        halsFile.close()
+        # Split only at newlines, as readlines() would, since splitlines()
+        # also splits at form feeds and the like, which would throw off
+        # the line numbering.
+        with open(param, "r") as halsFile:
+            lines = halsFile.read().split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        halsSource += lines
         if len(halsSource) == start:
             continue
         for i in range(len(metadata), len(halsSource)):
@@ -112,19 +112,18 @@ for param in ["--library="+libraryFilename] + sys.argv[1:]:
         libraryFilename = param[10:].strip()
         #print("Here", libraryFilename)
         # Read the structure-template library file.  This is just a text file
-        # in which each line is a HAL/S STRUCTURE statement.
+        # in which each line is a HAL/S STRUCTURE statement, of which only
+        # the first two words are needed to identify the template.
         try:
-            f = open(libraryFilename, "r")
-            for line in f:
-                fields = line.split()
-                identifier = fields[1]
-                if identifier[-1:] == ":":
-                    identifier = identifier[:-1]
-                if identifier in structureTemplates:
-                    print("Overwriting structure-template", identifier, \
-                            file=sys.stderr)
-                structureTemplates[identifier] = line.strip()
-            f.close()
+            with open(libraryFilename, "r") as f:
+                for line in f:
+                    identifier = line.split(None, 2)[1]
+                    if identifier[-1:] == ":":
+                        identifier = identifier[:-1]
+                    if identifier in structureTemplates:
+                        print("Overwriting structure-template", identifier, \
+                                file=sys.stderr)
+                    structureTemplates[identifier] = line.strip()
             #print(structureTemplates)
         except:
             print("FYI: Structure-template library file", libraryFilename, \
@@ -139,24 +138,27 @@ for param in ["--library="+libraryFilename] + sys.argv[1:]:
             continue
         first = True
         for i in range(len(metadata), len(halsSource)):
+            line = halsSource[i]
+            column1 = line[:1]
             m = {}
             if first:
                 m["file"] = param
                 first = False
-            if halsSource[i][:1] == "C":
+            if column1 == "C":
                 m["comment"] = True
-            elif halsSource[i][:1] == "D":
+            elif column1 == "D":
                 m["directive"] = True
                 # If this is an INCLUDE TEMPLATE directive, then replace the
                 # input line by the requested library template and append
                 # the original line to the end of it as an inline comment.
-                fields = halsSource[i].split()
+                # Only the first 4 words of the directive matter.
+                fields = line.split(None, 4)
                 if len(fields) >= 4 and fields[1] == "INCLUDE" and \
                         fields[2] == "TEMPLATE":
                     templateName = fields[3]
                     if templateName in structureTemplates:
                         halsSource[i] = " " + structureTemplates[templateName] \
-                            + "\t/*" + halsSource[i].strip()+ " */"
+                            + "\t/*" + line.strip()+ " */"
                     else:
                         m["errors"] = ["Structure template " + templateName + \
                             " requested by compiler directive not in libary."]